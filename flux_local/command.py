@@ -48,7 +48,7 @@ class Command(Task):
     cmd: list[str]
     """Array of command line arguments."""
 
-    cwd: Path | None = None
+    cwd: Path | str | None = None
     """Current working directory."""
 
     exc: type[CommandException] = CommandException
@@ -69,24 +69,31 @@ class Command(Task):
         """Render as a debug string."""
         cwd: str = ""
         if self.cwd:
-            cwd = f"({format_path(self.cwd)}) "
+            cwd = f"({format_path(Path(self.cwd))}) "
         return f"{cwd}{self.string}"
 
     async def run(self, stdin: bytes | None = None) -> bytes:
         """Run the command, returning stdout."""
         _LOGGER.debug("Running command: %s", self)
-        env = {
-            **os.environ,
-            **(self.env if self.env else {}),
-        }
-        proc = await asyncio.create_subprocess_shell(
-            self.string,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=self.cwd,
-            env=env,
-        )
+        # The child inherits the environment as-is unless overrides are given
+        env = {**os.environ, **self.env} if self.env else None
+        # Execute directly rather than through a shell to avoid spawning an
+        # intermediate /bin/sh for every command.
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self.cwd,
+                env=env,
+            )
+        except OSError as error:
+            if isinstance(error, FileNotFoundError) and error.filename == self.cmd[0]:
+                raise self.exc(
+                    f"Command '{self}' failed: {self.cmd[0]}: command not found"
+                ) from error
+            raise self.exc(f"Command '{self}' failed to start: {error}") from error
         out, err = await proc.communicate(stdin)
         if proc.returncode:
             if self.retcodes and proc.returncode in self.retcodes:
@@ -6,11 +6,16 @@ import logging
 from pathlib import Path
 from shutil import rmtree
 
+import aiofiles
 from slugify import slugify
 from urllib.parse import urlparse
 
 _LOGGER = logging.getLogger(__name__)
 
+# File written to a repository path once it has been fetched, containing the
+# fetched digest
+_FETCHED_MARKER = ".flux-local-fetched"
+
 
 class GitError(Exception):
     """Exception raised for git operations."""
@@ -111,6 +116,40 @@ class GitCache:
             _LOGGER.error(f"Unexpected error creating cache path for {url}: {e}")
             raise GitError(f"Unexpected error creating cache path: {e}") from e
 
+    async def is_fresh(self, repo_path: Path, digest: str | None) -> bool:
+        """Check if a repository was already fetched at the specified digest.
+
+        Only a digest identifies immutable contents. Tags and semver ranges
+        may move upstream, so repositories referenced that way are never
+        fresh and callers pass None for them.
+
+        Args:
+            repo_path: The local path returned by get_repo_path
+            digest: The content digest of the repository, if pinned
+
+        Returns:
+            bool: True if the cached repository contents can be used as-is
+        """
+        if digest is None:
+            return False
+        try:
+            async with aiofiles.open(repo_path / _FETCHED_MARKER) as marker_file:
+                return await marker_file.read() == digest
+        except FileNotFoundError:
+            return False
+
+    async def mark_fresh(self, repo_path: Path, digest: str | None) -> None:
+        """Record that a repository was fetched at the specified digest.
+
+        Args:
+            repo_path: The local path returned by get_repo_path
+            digest: The content digest of the repository, if pinned
+        """
+        if digest is None:
+            return
+        async with aiofiles.open(repo_path / _FETCHED_MARKER, mode="w") as marker_file:
+            await marker_file.write(digest)
+
     def cleanup(self) -> None:
         """Clean up all cached repositories."""
         try:
@@ -122,7 +122,10 @@ class SourceController:
             _LOGGER.debug("Artifact for %s already exists, skipping fetch", resource_id)
             return
 
-        await self.fetch(resource_id, obj)
+        try:
+            await self.fetch(resource_id, obj)
+        except Exception as e:
+            self._store.update_status(resource_id, Status.FAILED, error=str(e))
 
     async def fetch(self, resource_id: NamedResource, obj: BaseManifest) -> None:
         """Fetch a source artifact based on repository type.
@@ -1,10 +1,19 @@
 """Helm chart dependency management."""
 
+import asyncio
+import hashlib
 import logging
-from pathlib import Path
+import os
+import re
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from flux_local import command
 from flux_local.exceptions import HelmException
 
@@ -12,6 +21,36 @@ _LOGGER = logging.getLogger(__name__)
 
 HELM_BIN = "helm"
 
+# Maximum number of concurrent `helm dependency build` invocations. Each chart
+# is built by its own helm process since helm has no batch mode; chaining the
+# builds in a single shell would still start one helm per chart while losing
+# concurrency and per-chart error reporting.
+_HELM_DEP_CONCURRENCY = 4
+
+# Chart.yaml files are typically small enough to be read in a single call
+_CHART_HEAD_SIZE = 8192
+
+# Matches a top-level dependencies key in the raw Chart.yaml contents. Any
+# match is confirmed by a full parse, so it does not check the value shape.
+_DEPS_RE = re.compile(rb"(?m)^dependencies[ \t]*:")
+
+# Parsed Chart.yaml contents keyed by path, stored with the (mtime, size) they
+# were read at so a modified file replaces its entry. Charts without
+# dependencies are stored as an empty dict.
+_CHART_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+# Parsed Chart.yaml contents keyed by a digest of the file contents, shared
+# across paths since many repositories vendor identical charts. This is
+# per-process and unbounded by design: it only holds charts that declare
+# dependencies, and is reset with clear_chart_cache().
+_CONTENT_CACHE: dict[bytes, dict[str, Any]] = {}
+
+
+def clear_chart_cache() -> None:
+    """Clear the cache of parsed Chart.yaml files."""
+    _CHART_CACHE.clear()
+    _CONTENT_CACHE.clear()
+
 
 async def build_helm_dependencies(local_path: str) -> None:
     """Build Helm chart dependencies for any charts found in the local path.
@@ -25,77 +64,268 @@ async def build_helm_dependencies(local_path: str) -> None:
     Raises:
         HelmException: If helm dependency build fails
     """
-    path = Path(local_path)
-    if not path.exists():
+    if not os.path.exists(local_path):
         _LOGGER.debug("Path %s does not exist, skipping dependency build", local_path)
         return
-        
-    # Find all Chart.yaml files recursively
-    chart_files = list(path.rglob("Chart.yaml"))
-    if not chart_files:
-        _LOGGER.debug("No Chart.yaml files found in %s", local_path)
+
+    # Discovery and parsing are blocking filesystem operations, so run them
+    # in a worker thread to keep the event loop responsive.
+    charts = await asyncio.to_thread(_collect_charts_with_deps, local_path)
+    if not charts:
         return
-        
-    _LOGGER.debug("Found %d Chart.yaml files in %s", len(chart_files), local_path)
-    
-    for chart_file in chart_files:
-        await _build_chart_dependencies(chart_file)
 
+    sem = asyncio.Semaphore(_HELM_DEP_CONCURRENCY)
+
+    async def _build_one(chart_dir: str, chart_name: str, num_deps: int) -> None:
+        async with sem:
+            await _build_chart_dependencies(chart_dir, chart_name, num_deps)
+
+    await asyncio.gather(*[_build_one(*chart) for chart in charts])
+
+
+def _collect_charts_with_deps(root: str) -> list[tuple[str, str, int]]:
+    """Find all charts under the root directory that need dependencies built.
+
+    Args:
+        root: Directory to search for Helm charts
+
+    Returns:
+        A list of (chart directory, chart name, number of dependencies) tuples.
+
+    Raises:
+        HelmException: If a Chart.yaml file cannot be read
+    """
+    chart_dirs = _find_charts(root)
+    if not chart_dirs:
+        _LOGGER.debug("No Chart.yaml files found in %s", root)
+        return []
+
+    charts: list[tuple[str, str, int]] = []
+    num_no_deps = 0
+    num_satisfied = 0
+    for chart_dir in chart_dirs:
+        if (chart_data := _safe_parse(chart_dir)) is None:
+            continue
+
+        # Check if chart has dependencies
+        dependencies = chart_data.get("dependencies")
+        if not dependencies:
+            num_no_deps += 1
+            continue
+
+        if _dependencies_satisfied(chart_dir, dependencies):
+            num_satisfied += 1
+            continue
+        charts.append((chart_dir, chart_data.get("name", "unknown"), len(dependencies)))
+
+    _LOGGER.debug(
+        "Found %d Chart.yaml files in %s (%d without dependencies, %d already built)",
+        len(chart_dirs),
+        root,
+        num_no_deps,
+        num_satisfied,
+    )
+    return charts
+
+
+def _safe_parse(chart_dir: str) -> dict[str, Any] | None:
+    """Load a chart's Chart.yaml file, returning None if it cannot be parsed.
+
+    Args:
+        chart_dir: Path to the chart directory
+
+    Raises:
+        HelmException: If the Chart.yaml file cannot be read
+    """
+    try:
+        return _load_chart(chart_dir)
+    except yaml.YAMLError as e:
+        _LOGGER.warning("Failed to parse Chart.yaml in %s: %s", chart_dir, e)
+        return None
+    except OSError as e:
+        _LOGGER.error("Failed to read Chart.yaml in %s: %s", chart_dir, e)
+        raise HelmException(f"Failed to read Chart.yaml in {chart_dir}: {e}") from e
+
+
+def _find_charts(root: str) -> list[str]:
+    """Find all chart directories containing a Chart.yaml under the root directory.
+
+    Unpacked subcharts under a chart's charts/ directory are included since
+    `helm dependency build` does not recurse into them. Packaged subcharts
+    are archives and are never descended into.
+
+    Args:
+        root: Directory to search for Helm charts
+    """
+    chart_dirs: list[str] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError as e:
+            _LOGGER.debug("Unable to scan directory %s: %s", current, e)
+            continue
+        if any(entry.name == "Chart.yaml" and entry.is_file() for entry in entries):
+            chart_dirs.append(current)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and entry.name != ".git":
+                stack.append(entry.path)
+    return chart_dirs
+
+
+def _read_chart(chart_file: str) -> bytes:
+    """Read the raw contents of a Chart.yaml file.
 
-async def _build_chart_dependencies(chart_file: Path) -> None:
+    The file is read with a single bounded read, falling back to reading the
+    remainder only for uncommonly large files.
+    """
+    fd = os.open(chart_file, os.O_RDONLY)
+    try:
+        data = os.read(fd, _CHART_HEAD_SIZE)
+        if len(data) < _CHART_HEAD_SIZE:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, _CHART_HEAD_SIZE):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _parse_chart(data: bytes) -> dict[str, Any] | None:
+    """Parse the Chart.yaml fields needed for building dependencies.
+
+    Only the `name` and `dependencies` keys are retained so that cached
+    entries do not hold on to unrelated chart metadata.
+
+    Returns:
+        A dict with the `name` and `dependencies` keys, or None if the
+        contents are not a mapping.
+
+    Raises:
+        yaml.YAMLError: If the contents cannot be parsed
+    """
+    parsed = yaml.load(data, Loader=_SafeLoader)
+    if not isinstance(parsed, dict):
+        return None
+    return {
+        "name": parsed.get("name", "unknown"),
+        "dependencies": parsed.get("dependencies") or [],
+    }
+
+
+def _load_chart(chart_dir: str) -> dict[str, Any]:
+    """Load the contents of a chart's Chart.yaml file.
+
+    Results are cached until the file is modified, and charts with identical
+    contents at different paths are only parsed once. An empty dict is returned
+    for charts without dependencies or with an invalid format.
+
+    Args:
+        chart_dir: Path to the chart directory
+
+    Raises:
+        yaml.YAMLError: If the Chart.yaml file cannot be parsed
+    """
+    chart_file = os.path.join(chart_dir, "Chart.yaml")
+    st = os.stat(chart_file)
+    if (cached := _CHART_CACHE.get(chart_file)) is not None:
+        mtime_ns, size, chart_data = cached
+        if mtime_ns == st.st_mtime_ns and size == st.st_size:
+            return chart_data
+
+    data = _read_chart(chart_file)
+    chart_data = {}
+    # Most charts have no dependencies, so avoid invoking the YAML parser
+    # unless a top-level dependencies key is present
+    if _DEPS_RE.search(data):
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if (parsed := _CONTENT_CACHE.get(digest)) is None:
+            parsed = _parse_chart(data)
+        if parsed is not None:
+            _CONTENT_CACHE[digest] = parsed
+            chart_data = parsed
+        else:
+            _LOGGER.warning("Invalid Chart.yaml format in %s", chart_file)
+
+    _CHART_CACHE[chart_file] = (st.st_mtime_ns, st.st_size, chart_data)
+    return chart_data
+
+
+def _dependencies_satisfied(chart_dir: str, dependencies: list[dict[str, Any]]) -> bool:
+    """Return True if charts/ already contains every declared dependency.
+
+    Dependencies are matched by their `name-version.tgz` archive name, so
+    version ranges are never considered satisfied. A Chart.lock newer than
+    the archives indicates they may be stale and need to be rebuilt.
+
+    Args:
+        chart_dir: Path to the chart directory
+        dependencies: The dependencies declared in Chart.yaml
+    """
+    try:
+        with os.scandir(os.path.join(chart_dir, "charts")) as it:
+            archives = {
+                entry.name: entry.stat().st_mtime_ns
+                for entry in it
+                if entry.name.endswith(".tgz") and entry.is_file()
+            }
+    except OSError:
+        # Missing or unreadable charts/ directory, so let helm build it
+        return False
+    if not archives:
+        return False
+    for dep in dependencies:
+        if not isinstance(dep, dict) or not dep.get("name") or not dep.get("version"):
+            return False
+        if f"{dep['name']}-{dep['version']}.tgz" not in archives:
+            return False
+    try:
+        lock_mtime = os.stat(os.path.join(chart_dir, "Chart.lock")).st_mtime_ns
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    return lock_mtime <= max(archives.values())
+
+
+async def _build_chart_dependencies(
+    chart_dir: str, chart_name: str, num_deps: int
+) -> None:
     """Build dependencies for a single Helm chart.
     
     Args:
-        chart_file: Path to the Chart.yaml file
+        chart_dir: Path to the chart directory
+        chart_name: Name of the chart, for logging
+        num_deps: Number of dependencies declared by the chart, for logging
         
     Raises:
         HelmException: If helm dependency build fails
     """
-    chart_dir = chart_file.parent
-    
+    _LOGGER.info(
+        "Building %d dependencies for chart %s at %s",
+        num_deps,
+        chart_name,
+        chart_dir,
+    )
+
+    # Run helm dependency build in the chart directory
+    args = [HELM_BIN, "dependency", "build"]
+    cmd = command.Command(
+        args,
+        cwd=chart_dir,
+        exc=HelmException
+    )
     try:
-        # Read and parse Chart.yaml
-        chart_content = chart_file.read_text(encoding="utf-8")
-        chart_data = yaml.safe_load(chart_content)
-        
-        if not isinstance(chart_data, dict):
-            _LOGGER.warning("Invalid Chart.yaml format in %s", chart_file)
-            return
-            
-        # Check if chart has dependencies
-        dependencies = chart_data.get("dependencies", [])
-        if not dependencies:
-            _LOGGER.debug("No dependencies found in %s", chart_file)
-            return
-            
-        _LOGGER.info(
-            "Found %d dependencies in chart %s, building dependencies",
-            len(dependencies),
-            chart_data.get("name", "unknown")
-        )
-        
-        # Run helm dependency build in the chart directory
-        args = [HELM_BIN, "dependency", "build"]
-        cmd = command.Command(
-            args,
-            cwd=chart_dir,
-            exc=HelmException
-        )
-        
         await command.run(cmd)
-        
-        _LOGGER.info(
-            "Successfully built dependencies for chart %s at %s",
-            chart_data.get("name", "unknown"),
-            chart_dir
-        )
-        
-    except yaml.YAMLError as e:
-        _LOGGER.warning("Failed to parse Chart.yaml at %s: %s", chart_file, e)
     except Exception as e:
         _LOGGER.error(
             "Failed to build dependencies for chart at %s: %s",
             chart_dir,
             e
         )
-        raise HelmException(f"Failed to build dependencies for chart at {chart_dir}: {e}") from e
\ No newline at end of file
+        raise HelmException(f"Failed to build dependencies for chart at {chart_dir}: {e}") from e
+
+    _LOGGER.info("Successfully built dependencies for chart %s", chart_name)
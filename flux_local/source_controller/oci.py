@@ -1,6 +1,10 @@
 """OCI repository controller."""
 
+import asyncio
+from collections.abc import Iterable
 import logging
+import threading
+from urllib.parse import urlparse
 
 from flux_local.manifest import OCIRepository
 from oras.client import OrasClient
@@ -11,23 +15,97 @@ from .helm_deps import build_helm_dependencies
 
 _LOGGER = logging.getLogger(__name__)
 
+# Default maximum number of concurrent OCI repository fetches
+_FETCH_CONCURRENCY = 4
+
+# OrasClient per registry host, reused to share HTTP connections and auth.
+# Pulls run in worker threads and a requests.Session is not thread-safe, so
+# each thread keeps its own clients, released along with the thread.
+_ORAS_LOCAL = threading.local()
+
+
+def clear_oras_clients() -> None:
+    """Clear the cache of OrasClient instances."""
+    global _ORAS_LOCAL
+    _ORAS_LOCAL = threading.local()
+
+
+def _get_oras_client(url: str) -> OrasClient:
+    """Return the OrasClient for the registry of the url in the current thread."""
+    clients: dict[str, OrasClient] | None = getattr(_ORAS_LOCAL, "clients", None)
+    if clients is None:
+        clients = {}
+        _ORAS_LOCAL.clients = clients
+    netloc = urlparse(url).netloc
+    if (client := clients.get(netloc)) is None:
+        client = OrasClient()
+        clients[netloc] = client
+    return client
+
+
+def _pull(url: str, target: str, outdir: str) -> list[str]:
+    """Pull an OCI artifact, blocking until complete."""
+    files: list[str] = _get_oras_client(url).pull(target=target, outdir=outdir)
+    return files
+
 
 async def fetch_oci(obj: OCIRepository) -> OCIArtifact:
-    """Fetch an OCI repository."""
+    """Fetch an OCI repository.
+
+    Any Helm chart dependencies in the repository are built before the
+    artifact is returned.
+    """
     cache = get_git_cache()
     oci_repo_path = cache.get_repo_path(obj.url, obj.version())
 
+    # Only a digest pins immutable contents that can be reused across fetches
+    digest = obj.ref.digest if obj.ref else None
+    if await cache.is_fresh(oci_repo_path, digest):
+        _LOGGER.debug("OCI repository %s already fetched to %s", obj, oci_repo_path)
+        return OCIArtifact(
+            url=obj.url,
+            ref=obj.ref,
+            local_path=str(oci_repo_path),
+        )
+
     _LOGGER.info("Fetching OCI repository %s", obj)
-    client = OrasClient()
-    res = await client.pull(target=obj.versioned_url(), outdir=str(oci_repo_path))
+    # OrasClient.pull is blocking, so run it in a worker thread to allow
+    # multiple pulls to proceed concurrently
+    res = await asyncio.to_thread(
+        _pull, obj.url, obj.versioned_url(), str(oci_repo_path)
+    )
     _LOGGER.debug("Downloaded resources: %s", res)
-    
+
     # Build Helm chart dependencies if any charts are found
     _LOGGER.debug("Checking for Helm charts with dependencies in %s", oci_repo_path)
     await build_helm_dependencies(str(oci_repo_path))
-    
+    await cache.mark_fresh(oci_repo_path, digest)
+
     return OCIArtifact(
         url=obj.url,
         ref=obj.ref,
         local_path=str(oci_repo_path),
     )
+
+
+async def fetch_oci_many(
+    objs: Iterable[OCIRepository], concurrency: int = _FETCH_CONCURRENCY
+) -> list[OCIArtifact]:
+    """Fetch multiple OCI repositories concurrently.
+
+    Args:
+        objs: The OCIRepository objects to fetch
+        concurrency: Maximum number of repositories fetched at once, including
+            building their Helm chart dependencies
+
+    Returns:
+        The artifacts, in the same order as the input objects, with any Helm
+        chart dependencies built
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _fetch_one(obj: OCIRepository) -> OCIArtifact:
+        async with sem:
+            return await fetch_oci(obj)
+
+    return list(await asyncio.gather(*[_fetch_one(obj) for obj in objs]))
@@ -4,12 +4,14 @@ import asyncio
 import tempfile
 from pathlib import Path
 from collections.abc import AsyncGenerator, Generator
-from unittest.mock import patch, AsyncMock
+import threading
+from unittest.mock import patch, MagicMock
 
 import pytest
 import git
 import yaml
 
+from flux_local.exceptions import HelmException
 from flux_local.manifest import (
     NamedResource,
     BaseManifest,
@@ -20,6 +22,12 @@ from flux_local.store.in_memory import InMemoryStore
 from flux_local.store.status import Status
 from flux_local.store.store import StoreEvent
 from flux_local.source_controller import GitArtifact, OCIArtifact, SourceController
+from flux_local.source_controller.cache import GitCache
+from flux_local.source_controller.oci import (
+    clear_oras_clients,
+    fetch_oci,
+    fetch_oci_many,
+)
 from flux_local.task import get_task_service, task_service_context, TaskService
 
 
@@ -30,6 +38,23 @@ def task_service_fixture() -> Generator[TaskService, None, None]:
         yield service
 
 
+@pytest.fixture(autouse=True)
+def clear_oras_clients_fixture() -> Generator[None, None, None]:
+    """Clear the shared OrasClient instances between tests."""
+    clear_oras_clients()
+    yield
+    clear_oras_clients()
+
+
+@pytest.fixture(autouse=True)
+def oci_cache_fixture(tmp_path: Path) -> Generator[None, None, None]:
+    """Fetch OCI repositories into a cache directory private to each test."""
+    with patch("tempfile.tempdir", str(tmp_path)):
+        cache = GitCache()
+    with patch("flux_local.source_controller.oci.get_git_cache", return_value=cache):
+        yield
+
+
 @pytest.fixture(name="git_repo_tmp_dir", scope="module")
 def git_repo_tmp_dir_fixture() -> Generator[Path, None, None]:
     """Create a temporary directory for test resources."""
@@ -174,7 +199,7 @@ async def test_oci_repository_reconciliation(
 
     # Add the object to trigger reconciliation
     with patch("flux_local.source_controller.oci.OrasClient") as mock_client:
-        mock_pull = AsyncMock()
+        mock_pull = MagicMock()
         mock_pull.return_value = []  # Resources
         mock_client.return_value.pull = mock_pull
         store.add_object(oci_repo)
@@ -194,6 +219,158 @@ async def test_oci_repository_reconciliation(
     remove_listener()
 
 
+@pytest.mark.asyncio
+async def test_oci_repository_ready_after_helm_dependencies(
+    oci_repo: OCIRepository, store: InMemoryStore, controller: SourceController
+) -> None:
+    """Test an OCI repository is not ready until Helm dependencies are built."""
+    rid = NamedResource(oci_repo.kind, oci_repo.namespace, oci_repo.name)
+    statuses_during_build = []
+
+    async def build_helm_dependencies(local_path: str) -> None:
+        await asyncio.sleep(0)
+        statuses_during_build.append(store.get_status(rid))
+
+    with patch("flux_local.source_controller.oci.OrasClient") as mock_client, patch(
+        "flux_local.source_controller.oci.build_helm_dependencies",
+        side_effect=build_helm_dependencies,
+    ):
+        mock_client.return_value.pull = MagicMock(return_value=[])
+        await controller.reconcile(rid, oci_repo)
+
+    assert len(statuses_during_build) == 1
+    assert statuses_during_build[0] is not None
+    assert statuses_during_build[0].status == Status.PENDING
+    status = store.get_status(rid)
+    assert status is not None
+    assert status.status == Status.READY
+
+
+@pytest.mark.asyncio
+async def test_oci_repository_helm_dependencies_failure(
+    oci_repo: OCIRepository, store: InMemoryStore, controller: SourceController
+) -> None:
+    """Test an OCI repository fails when Helm dependencies cannot be built."""
+    rid = NamedResource(oci_repo.kind, oci_repo.namespace, oci_repo.name)
+
+    with patch("flux_local.source_controller.oci.OrasClient") as mock_client, patch(
+        "flux_local.source_controller.oci.build_helm_dependencies",
+        side_effect=HelmException("Dependency build failed"),
+    ):
+        mock_client.return_value.pull = MagicMock(return_value=[])
+        await controller.reconcile(rid, oci_repo)
+
+    status = store.get_status(rid)
+    assert status is not None
+    assert status.status == Status.FAILED
+    assert status.error is not None
+    assert "Dependency build failed" in status.error
+    assert store.get_artifact(rid, OCIArtifact) is None
+
+
+@pytest.mark.asyncio
+async def test_oci_repository_added_helm_dependencies_failure(
+    oci_repo: OCIRepository, store: InMemoryStore, controller: SourceController
+) -> None:
+    """Test an added OCI repository fails when Helm dependencies cannot be built."""
+    rid = NamedResource(oci_repo.kind, oci_repo.namespace, oci_repo.name)
+
+    with patch("flux_local.source_controller.oci.OrasClient") as mock_client, patch(
+        "flux_local.source_controller.oci.build_helm_dependencies",
+        side_effect=HelmException("Dependency build failed"),
+    ):
+        mock_client.return_value.pull = MagicMock(return_value=[])
+        store.add_object(oci_repo)
+        await get_task_service().block_till_done()
+
+    status = store.get_status(rid)
+    assert status is not None
+    assert status.status == Status.FAILED
+    assert status.error is not None
+    assert "Dependency build failed" in status.error
+    assert store.get_artifact(rid, OCIArtifact) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_oci_many() -> None:
+    """Test fetching multiple OCI repositories concurrently."""
+    objs = [
+        OCIRepository.parse_doc(
+            yaml.safe_load(
+                f"""
+    apiVersion: source.toolkit.fluxcd.io/v1
+    kind: OCIRepository
+    metadata:
+      name: test-oci-repo-{i}
+      namespace: test-ns
+    spec:
+      url: oci://example.com/repo-{i}
+      ref:
+        tag: v1.0.0
+      interval: 1m0s
+    """
+            )
+        )
+        for i in range(4)
+    ]
+
+    # Each pull blocks until another pull is running at the same time, which
+    # only succeeds if pulls do not block the event loop.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def pull(target: str, outdir: str) -> list[str]:
+        barrier.wait()
+        return []
+
+    with patch("flux_local.source_controller.oci.OrasClient") as mock_client:
+        mock_pull = MagicMock(side_effect=pull)
+        mock_client.return_value.pull = mock_pull
+        artifacts = await fetch_oci_many(objs, concurrency=2)
+
+    assert [artifact.url for artifact in artifacts] == [obj.url for obj in objs]
+    assert mock_pull.call_count == 4
+    # Concurrent pulls run in separate threads and do not share a client
+    assert mock_client.call_count >= 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("ref", "expected_pulls"),
+    [
+        ("digest: sha256:abc123", 1),
+        ("tag: latest", 2),
+        ('semver: ">=1.0.0"', 2),
+    ],
+)
+async def test_fetch_oci_already_fetched(ref: str, expected_pulls: int) -> None:
+    """Test that only OCI repositories pinned by digest skip repeated pulls."""
+    oci_repo = OCIRepository.parse_doc(
+        yaml.safe_load(
+            f"""
+    apiVersion: source.toolkit.fluxcd.io/v1
+    kind: OCIRepository
+    metadata:
+      name: test-oci-repo
+      namespace: test-ns
+    spec:
+      url: oci://example.com/repo
+      ref:
+        {ref}
+      interval: 1m0s
+    """
+        )
+    )
+    with patch("flux_local.source_controller.oci.OrasClient") as mock_client:
+        mock_pull = MagicMock()
+        mock_pull.return_value = []
+        mock_client.return_value.pull = mock_pull
+        artifact = await fetch_oci(oci_repo)
+        second_artifact = await fetch_oci(oci_repo)
+
+    assert mock_pull.call_count == expected_pulls
+    assert second_artifact == artifact
+
+
 @pytest.mark.asyncio
 async def test_git_repository_branch_reconciliation(
     git_repo_dir: Path, store: InMemoryStore, controller: SourceController
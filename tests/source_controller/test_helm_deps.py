@@ -1,5 +1,6 @@
 """Tests for Helm dependency building functionality."""
 
+import os
 import tempfile
 from pathlib import Path
 from collections.abc import Generator
@@ -13,7 +14,10 @@ from flux_local.manifest import GitRepository, NamedResource
 from flux_local.store.in_memory import InMemoryStore
 from flux_local.store.status import Status
 from flux_local.source_controller import GitArtifact, SourceController
-from flux_local.source_controller.helm_deps import build_helm_dependencies
+from flux_local.source_controller.helm_deps import (
+    build_helm_dependencies,
+    clear_chart_cache,
+)
 from flux_local.task import task_service_context, TaskService
 
 
@@ -24,6 +28,14 @@ def task_service_fixture() -> Generator[TaskService, None, None]:
         yield service
 
 
+@pytest.fixture(autouse=True)
+def clear_chart_cache_fixture() -> Generator[None, None, None]:
+    """Clear the parsed Chart.yaml cache between tests."""
+    clear_chart_cache()
+    yield
+    clear_chart_cache()
+
+
 @pytest.fixture(name="temp_dir")
 def temp_dir_fixture() -> Generator[Path, None, None]:
     """Create a temporary directory for test resources."""
@@ -185,6 +197,255 @@ dependencies:
         assert str(args.cwd) == str(chart_dir)
 
 
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_multiple_charts(temp_dir: Path) -> None:
+    """Test dependency building runs for every chart with dependencies."""
+    chart_dirs = []
+    for i in range(3):
+        chart_dir = temp_dir / f"chart-{i}"
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text(f"""
+apiVersion: v2
+name: chart-{i}
+version: 1.0.0
+
+dependencies:
+  - name: nginx
+    version: "15.4.4"
+    repository: "https://charts.bitnami.com/bitnami"
+        """.strip())
+        chart_dirs.append(chart_dir)
+
+    with patch("flux_local.command.run") as mock_run:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+
+        assert mock_run.call_count == 3
+        cwds = {str(call[0][0].cwd) for call in mock_run.call_args_list}
+        assert cwds == {str(chart_dir) for chart_dir in chart_dirs}
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_chart_cache(temp_dir: Path) -> None:
+    """Test that unchanged Chart.yaml files are only parsed once."""
+    chart_dir = temp_dir / "cached-chart"
+    chart_dir.mkdir()
+
+    chart_yaml = chart_dir / "Chart.yaml"
+    chart_yaml.write_text("""
+apiVersion: v2
+name: cached-chart
+version: 1.0.0
+
+dependencies:
+  - name: nginx
+    version: "15.4.4"
+    repository: "https://charts.bitnami.com/bitnami"
+    """.strip())
+
+    with patch("flux_local.command.run") as mock_run, patch(
+        "flux_local.source_controller.helm_deps.yaml.load", wraps=yaml.load
+    ) as mock_load:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        await build_helm_dependencies(str(temp_dir))
+        assert mock_load.call_count == 1
+        assert mock_run.call_count == 2
+
+        # Modifying the chart invalidates the cached entry
+        chart_yaml.write_text("""
+apiVersion: v2
+name: cached-chart
+version: 1.0.1
+    """.strip())
+        await build_helm_dependencies(str(temp_dir))
+        assert mock_run.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_identical_charts(temp_dir: Path) -> None:
+    """Test that identical Chart.yaml contents at different paths are parsed once."""
+    for chart in ("first", "second"):
+        chart_dir = temp_dir / chart
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text("""
+apiVersion: v2
+name: common
+version: 1.0.0
+
+dependencies:
+  - name: nginx
+    version: "15.4.4"
+    repository: "https://charts.bitnami.com/bitnami"
+    """.strip())
+
+    with patch("flux_local.command.run") as mock_run, patch(
+        "flux_local.source_controller.helm_deps.yaml.load", wraps=yaml.load
+    ) as mock_load:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        assert mock_load.call_count == 1
+        assert mock_run.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_already_present(temp_dir: Path) -> None:
+    """Test that helm is not invoked when charts/ satisfies all dependencies."""
+    chart_dir = temp_dir / "built-chart"
+    chart_dir.mkdir()
+
+    chart_yaml = chart_dir / "Chart.yaml"
+    chart_yaml.write_text("""
+apiVersion: v2
+name: built-chart
+version: 1.0.0
+
+dependencies:
+  - name: nginx
+    version: "15.4.4"
+    repository: "https://charts.bitnami.com/bitnami"
+    """.strip())
+    lock_file = chart_dir / "Chart.lock"
+    lock_file.write_text("dependencies: []")
+    os.utime(lock_file, ns=(1_000_000_000, 1_000_000_000))
+    charts_dir = chart_dir / "charts"
+    charts_dir.mkdir()
+    archive = charts_dir / "nginx-15.4.4.tgz"
+    archive.write_text("mock chart package")
+
+    with patch("flux_local.command.run") as mock_run:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        mock_run.assert_not_called()
+
+        # A Chart.lock newer than the archives requires a rebuild
+        os.utime(archive, ns=(500_000_000, 500_000_000))
+        await build_helm_dependencies(str(temp_dir))
+        mock_run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_charts_not_a_directory(temp_dir: Path) -> None:
+    """Test that a charts file that is not a directory falls back to helm."""
+    chart_dir = temp_dir / "odd-chart"
+    chart_dir.mkdir()
+
+    (chart_dir / "Chart.yaml").write_text("""
+apiVersion: v2
+name: odd-chart
+version: 1.0.0
+
+dependencies:
+  - name: nginx
+    version: "15.4.4"
+    repository: "https://charts.bitnami.com/bitnami"
+    """.strip())
+    (chart_dir / "charts").write_text("not a directory")
+
+    with patch("flux_local.command.run") as mock_run:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        mock_run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_unpacked_subcharts(temp_dir: Path) -> None:
+    """Test that unpacked subcharts with their own dependencies are built."""
+    chart_dir = temp_dir / "parent-chart"
+    subchart_dir = chart_dir / "charts" / "subchart"
+    subchart_dir.mkdir(parents=True)
+    (chart_dir / "charts" / "packaged-1.0.0.tgz").write_text("mock chart package")
+
+    deps = """
+dependencies:
+  - name: nginx
+    version: "15.4.4"
+    repository: "https://charts.bitnami.com/bitnami"
+    """
+    (chart_dir / "Chart.yaml").write_text(
+        "apiVersion: v2\nname: parent-chart\nversion: 1.0.0\n" + deps
+    )
+    (subchart_dir / "Chart.yaml").write_text(
+        "apiVersion: v2\nname: subchart\nversion: 1.0.0\n" + deps
+    )
+
+    with patch("flux_local.command.run") as mock_run:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        cwds = {str(call[0][0].cwd) for call in mock_run.call_args_list}
+        assert cwds == {str(chart_dir), str(subchart_dir)}
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_large_chart(temp_dir: Path) -> None:
+    """Test that dependencies declared past the initial read are found."""
+    chart_dir = temp_dir / "large-chart"
+    chart_dir.mkdir()
+
+    description = "x" * 16384
+    chart_yaml = chart_dir / "Chart.yaml"
+    chart_yaml.write_text(f"""
+apiVersion: v2
+name: large-chart
+description: {description}
+version: 1.0.0
+
+dependencies:
+  - name: nginx
+    version: "15.4.4"
+    repository: "https://charts.bitnami.com/bitnami"
+    """.strip())
+
+    with patch("flux_local.command.run") as mock_run:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        mock_run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_empty_dependencies(temp_dir: Path) -> None:
+    """Test that an empty dependencies list does not run helm dependency build."""
+    chart_dir = temp_dir / "empty-deps-chart"
+    chart_dir.mkdir()
+
+    chart_yaml = chart_dir / "Chart.yaml"
+    chart_yaml.write_text("""
+apiVersion: v2
+name: empty-deps-chart
+version: 1.0.0
+dependencies: []
+    """.strip())
+
+    with patch("flux_local.command.run") as mock_run:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        mock_run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_build_helm_dependencies_unindented_list(temp_dir: Path) -> None:
+    """Test dependency building when the dependency list is not indented."""
+    chart_dir = temp_dir / "unindented-chart"
+    chart_dir.mkdir()
+
+    chart_yaml = chart_dir / "Chart.yaml"
+    chart_yaml.write_text("""
+apiVersion: v2
+name: unindented-chart
+version: 1.0.0
+dependencies: # comment
+- name: nginx
+  version: "15.4.4"
+  repository: "https://charts.bitnami.com/bitnami"
+    """.strip())
+
+    with patch("flux_local.command.run") as mock_run:
+        mock_run.return_value = b""
+        await build_helm_dependencies(str(temp_dir))
+        mock_run.assert_called_once()
+        assert str(mock_run.call_args[0][0].cwd) == str(chart_dir)
+
+
 @pytest.mark.asyncio
 async def test_git_repository_with_helm_charts(
     umbrella_chart_git_repo: GitRepository,
@@ -1,5 +1,7 @@
 """Tests for command library."""
 
+from pathlib import Path
+
 import pytest
 
 from flux_local.command import Command, run, run_piped
@@ -27,3 +29,23 @@ async def test_failed_command() -> None:
     """Test a failing command."""
     with pytest.raises(CommandException, match="return code 1"):
         await run(Command(["/bin/false"]))
+
+
+async def test_missing_command() -> None:
+    """Test a command that does not exist."""
+    with pytest.raises(CommandException, match="command not found"):
+        await run(Command(["/bin/does-not-exist"]))
+
+
+async def test_missing_cwd(tmp_path: Path) -> None:
+    """Test a command run in a directory that does not exist."""
+    with pytest.raises(CommandException, match="failed to start"):
+        await run(Command(["echo", "Hello"], cwd=tmp_path / "does-not-exist"))
+
+
+async def test_command_env() -> None:
+    """Test environment variable overrides for a command."""
+    result = await run(
+        Command(["sh", "-c", "echo $FLUX_LOCAL_TEST"], env={"FLUX_LOCAL_TEST": "value"})
+    )
+    assert result == "value\n"